@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from os import environ
 from pathlib import Path
@@ -18,7 +19,14 @@ from pydrive2.drive import (  # pyright: ignore [reportMissingTypeStubs]
     GoogleDriveFile,
 )
 
-from core.backup import Action, Backup, Source, backup_term, sort_backups
+from core.backup import (
+    Action,
+    Backup,
+    Source,
+    backup_ready,
+    backup_term,
+    sort_backups,
+)
 from core.intercept import Intercept
 
 
@@ -60,54 +68,39 @@ def start() -> None:
         return
 
     drive_backups: dict[str, list[Backup]] = drive_collect(drive)
-    local_backups: dict[str, list[Backup]] = {}
-
-    if environ.get(f"{Source.Bazarr.upper()}_BACKUP_PATH"):
-        local_backups[Source.Bazarr] = local_collect(
-            Source.Bazarr,
-            env.path(f"{Source.Bazarr.upper()}_BACKUP_PATH"),
-            drive_backups,
-        )
-
-    if environ.get(f"{Source.Prowlarr.upper()}_BACKUP_PATH"):
-        local_backups[Source.Prowlarr] = local_collect(
-            Source.Prowlarr,
-            env.path(f"{Source.Prowlarr.upper()}_BACKUP_PATH"),
-            drive_backups,
-        )
+    local_paths: dict[Source, Path] = {}
 
-    if environ.get(f"{Source.Profilarr.upper()}_BACKUP_PATH"):
-        local_backups[Source.Profilarr] = local_collect(
-            Source.Profilarr,
-            env.path(f"{Source.Profilarr.upper()}_BACKUP_PATH"),
-            drive_backups,
-        )
-
-    if environ.get(f"{Source.Radarr.upper()}_BACKUP_PATH"):
-        local_backups[Source.Radarr] = local_collect(
-            Source.Radarr,
-            env.path(f"{Source.Radarr.upper()}_BACKUP_PATH"),
-            drive_backups,
-        )
-
-    if environ.get(f"{Source.Sonarr.upper()}_BACKUP_PATH"):
-        local_backups[Source.Sonarr] = local_collect(
-            Source.Sonarr,
-            env.path(f"{Source.Sonarr.upper()}_BACKUP_PATH"),
-            drive_backups,
-        )
+    for source in Source:
+        if environ.get(f"{source.upper()}_BACKUP_PATH"):
+            local_paths[source] = env.path(f"{source.upper()}_BACKUP_PATH")
 
     drive_uploaded: int = 0
     drive_deleted: int = 0
 
-    if environ.get("GOOGLE_DRIVE_FOLDER_ID"):
-        drive_uploaded = drive_upload(drive, local_backups, drive_backups)
+    if local_paths:
+        # Each source moves through its stages independently of the others
+        with ThreadPoolExecutor(max_workers=len(local_paths)) as executor:
+            results: list[Future[tuple[int, int]]] = [
+                executor.submit(process, drive, source, local_path, drive_backups)
+                for source, local_path in local_paths.items()
+            ]
 
-    if environ.get("BACKUP_RETAIN_LIMIT"):
-        # Update the list of Google Drive backups
-        drive_backups = drive_collect(drive)
+            for result in as_completed(results):
+                uploaded, deleted = result.result()
+
+                drive_uploaded += uploaded
+                drive_deleted += deleted
 
-        drive_deleted = drive_delete(drive, drive_backups)
+    if environ.get("BACKUP_RETAIN_LIMIT"):
+        # Sources without a configured backup path are still pruned in Google Drive
+        drive_deleted += drive_delete(
+            drive,
+            {
+                source: backups
+                for source, backups in drive_backups.items()
+                if source not in local_paths
+            },
+        )
 
     drive_total: int = drive_uploaded + drive_deleted
 
@@ -116,12 +109,48 @@ def start() -> None:
     )
 
 
+def process(
+    drive: GoogleDrive,
+    source: Source,
+    local_path: Path,
+    drive_backups: dict[str, list[Backup]],
+) -> tuple[int, int]:
+    """
+    Collect, upload, and delete backups for the provided backup source. Return
+    the number of backups uploaded and deleted.
+    """
+
+    uploaded: int = 0
+    deleted: int = 0
+
+    try:
+        local_backups: dict[str, list[Backup]] = {
+            source: local_collect(source, local_path, drive_backups)
+        }
+
+        if environ.get("GOOGLE_DRIVE_FOLDER_ID"):
+            uploaded = drive_upload(drive, local_backups, drive_backups)
+
+        if environ.get("BACKUP_RETAIN_LIMIT"):
+            # Uploaded backups were added to the existing list of Google Drive backups
+            deleted = drive_delete(drive, {source: drive_backups[source]})
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to process {source} backups")
+
+    return uploaded, deleted
+
+
 def local_collect(
     source: Source, local_path: Path, drive_backups: dict[str, list[Backup]]
 ) -> list[Backup]:
     """Return local backups for the provided backup source."""
 
     local_backups: list[Backup] = []
+    settle_seconds: int = 60
+    deferred: int = 0
+
+    if environ.get("BACKUP_SETTLE_SECONDS"):
+        settle_seconds = env.int("BACKUP_SETTLE_SECONDS")
 
     if local_path.is_dir() and local_path.exists():
         for local_file in local_path.glob("**/*.zip"):
@@ -154,6 +183,15 @@ def local_collect(
 
                 continue
 
+            if not backup_ready(local_file, settle_seconds):
+                logger.info(
+                    f"Deferred {local_backup.source} backup {local_backup.timestamp_formatted}, backup is still being written"
+                )
+
+                deferred += 1
+
+                continue
+
             local_backups.append(local_backup)
     else:
         logger.error(f"{local_path} is not a valid local {source} backup path")
@@ -169,7 +207,7 @@ def local_collect(
             )
 
     logger.info(
-        f"Collected {len(local_backups):,} local {source} {backup_term(len(local_backups))}"
+        f"Collected {len(local_backups):,} local {source} {backup_term(len(local_backups))} ({deferred:,} deferred)"
     )
     logger.trace(f"{local_backups=}")
 
@@ -292,6 +330,7 @@ def drive_upload(
 
     for source in local_backups:
         upload_count_source: int = 0
+        uploaded_backups: list[Backup] = []
 
         local_backups[source] = sort_backups(local_backups[source])
         drive_backups[source] = sort_backups(drive_backups[source])
@@ -346,6 +385,9 @@ def drive_upload(
                 local_backup.drive_url = (
                     str(file["alternateLink"]) if file["alternateLink"] else None  # pyright: ignore [reportUnknownArgumentType]
                 )
+                local_backup.drive_id = str(file["id"])  # pyright: ignore [reportUnknownArgumentType]
+
+                uploaded_backups.append(local_backup)
 
                 upload_count_total += 1
                 upload_count_source += 1
@@ -365,6 +407,9 @@ def drive_upload(
             if environ.get("DISCORD_WEBHOOK_URL"):
                 notify(local_backup, Action.Uploaded)
 
+        # Update the list of Google Drive backups without listing the folder again
+        drive_backups[source].extend(uploaded_backups)
+
     return upload_count_total
 
 
@@ -402,6 +447,8 @@ def drive_delete(drive: GoogleDrive, drive_backups: dict[str, list[Backup]]) ->
 
                     continue
 
+                deleted += 1
+
                 logger.info(
                     f"Deleted Google Drive {drive_backup.source} backup {drive_backup.timestamp_formatted} "
                 )
@@ -1,7 +1,10 @@
 from datetime import datetime
 from enum import Enum
+from os import stat_result
 from pathlib import Path
-from typing import Self
+from struct import unpack
+from time import time
+from typing import BinaryIO, Self
 
 from loguru import logger
 
@@ -183,3 +186,111 @@ def sort_backups(backups: list[Backup]) -> list[Backup]:
     """Return a list of backup objects sorted from newest to oldest."""
 
     return sorted(backups, key=lambda backup: backup.timestamp, reverse=True)
+
+
+def backup_ready(local_path: Path, settle_seconds: int) -> bool:
+    """
+    Return whether the provided local backup file has finished being written.
+
+    The file's size and modified time must have been stable for at least the
+    provided number of seconds, and its zip central directory must be intact.
+    """
+
+    try:
+        before: stat_result = local_path.stat()
+
+        if (time() - before.st_mtime) < settle_seconds:
+            logger.debug(
+                f"{local_path.name} was modified less than {settle_seconds:,}s ago"
+            )
+
+            return False
+
+        with local_path.open("rb") as file:
+            directory: tuple[int, int, int] | None = central_directory(
+                file, before.st_size
+            )
+
+        after: stat_result = local_path.stat()
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to read backup file {local_path}")
+
+        return False
+
+    if (before.st_size, before.st_mtime) != (after.st_size, after.st_mtime):
+        logger.debug(f"{local_path.name} changed while checking readiness")
+
+        return False
+
+    if not directory:
+        logger.debug(f"{local_path.name} is missing a zip central directory")
+
+        return False
+
+    directory_offset, directory_size, directory_end = directory
+
+    if directory_offset + directory_size > directory_end:
+        logger.debug(f"{local_path.name} has a truncated zip central directory")
+
+        return False
+
+    return True
+
+
+def central_directory(file: BinaryIO, file_size: int) -> tuple[int, int, int] | None:
+    """
+    Return the offset and size of the provided zip file's central directory,
+    along with the position it must end before. Return None if the End of
+    Central Directory record cannot be found.
+    """
+
+    # End of Central Directory record is 22 bytes plus a comment of up to 64KiB,
+    # preceded by the 20 byte zip64 locator and 56 byte zip64 record
+    tail_size: int = min(file_size, 56 + 20 + 22 + 65535)
+    tail_start: int = file_size - tail_size
+
+    file.seek(tail_start)
+
+    tail: bytes = file.read(tail_size)
+    eocd: int = len(tail)
+
+    # Archive comments may contain the signature, so confirm the comment length
+    # reaches exactly to the end of the file
+    while (eocd := tail.rfind(b"PK\x05\x06", 0, eocd)) != -1:
+        if len(tail) - eocd < 22:
+            continue
+
+        (comment_size,) = unpack("<H", tail[eocd + 20 : eocd + 22])
+
+        if eocd + 22 + comment_size == len(tail):
+            break
+    else:
+        return
+
+    directory_size, directory_offset = unpack("<II", tail[eocd + 12 : eocd + 20])
+
+    if 0xFFFFFFFF not in (directory_size, directory_offset):
+        return directory_offset, directory_size, tail_start + eocd
+
+    # Archives over 4GiB use zip64, where these fields are 0xFFFFFFFF and the real
+    # values live in a zip64 record found via the locator preceding the EOCD
+    locator: int = eocd - 20
+
+    if (locator < 0) or (tail[locator : locator + 4] != b"PK\x06\x07"):
+        return
+
+    (record_offset,) = unpack("<Q", tail[locator + 8 : locator + 16])
+
+    if record_offset + 56 > tail_start + locator:
+        return
+
+    file.seek(record_offset)
+
+    record: bytes = file.read(56)
+
+    if record[:4] != b"PK\x06\x06":
+        return
+
+    directory_size, directory_offset = unpack("<QQ", record[40:56])
+
+    return directory_offset, directory_size, record_offset